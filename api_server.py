@@ -36,6 +36,20 @@ def calculate_human_features(text):
         bonus = min((cv - 0.4) * 0.6, 0.3)
     return bonus
 
+def resolve_ai_label(config):
+    """与 core_engine._resolve_ai_label 同一套判定：语义词优先，数字命名
+    整体相等兜底，避免 '1' 子串误中 'label_10' 一类标签"""
+    if hasattr(config, 'id2label') and config.id2label:
+        labels = [(int(idx), str(label).lower()) for idx, label in config.id2label.items()]
+        for kw in ('fake', 'chatgpt', 'generated', 'ai'):
+            for idx, label in labels:
+                if kw in label:
+                    return idx
+        for idx, label in labels:
+            if label in ('1', 'label_1'):
+                return idx
+    return 1
+
 def smart_split_paragraph(text, max_chunk_size):
     """独立的平滑切分算法，应对超长文本拦截"""
     max_len = max_chunk_size
@@ -124,12 +138,7 @@ class APIModelWorker(threading.Thread):
             print(f"API 微服务加载模型异常: {e}")
             return
 
-        ai_label_id = 1
-        if hasattr(model.config, 'id2label') and model.config.id2label:
-            for idx, label in model.config.id2label.items():
-                if any(x in str(label).lower() for x in ['fake', 'ai', 'chatgpt', 'generated', '1']):
-                    ai_label_id = int(idx)
-                    break
+        ai_label_id = resolve_ai_label(model.config)
 
         print("⚡ API 微服务推理引擎已就绪，正在监听请求...")
 
@@ -141,7 +150,8 @@ class APIModelWorker(threading.Thread):
             resp_queue = task['resp_queue']
             
             try:
-                raw_paragraphs = [p for p in text.split("\n") if p.strip()]
+                # splitlines 单趟 C 级扫描，且原生兼容 \r\n / \r 换行
+                raw_paragraphs = [p for p in text.splitlines() if p.strip()]
                 paragraphs = []
                 max_chunk = self.config.get('max_chunk_size', 700)
                 
@@ -157,29 +167,34 @@ class APIModelWorker(threading.Thread):
                 temp = self.config.get('temperature', 2.0)
                 power = self.config.get('power_factor', 1.5)
                 min_len = self.config.get('min_valid_length', 20)
+                batch_size = max(1, self.config.get('batch_size', 16))
 
-                for para in paragraphs:
-                    inputs = tokenizer(para, return_tensors="pt", truncation=True, max_length=512)
+                # 整批前向代替逐段前向：同样的算力需求合并成少量大矩阵乘
+                for start in range(0, len(paragraphs), batch_size):
+                    batch = paragraphs[start:start + batch_size]
+                    inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=512)
                     inputs = {k: v.to(device) for k, v in inputs.items()}
-                    
+
                     with torch.no_grad():
                         outputs = model(**inputs)
                         scaled_logits = outputs.logits / temp
                         probs = F.softmax(scaled_logits, dim=-1)
-                        raw_ai_score = probs[0][ai_label_id].item()
+                        # 整批一次回传，避免逐段 .item() 的设备同步
+                        raw_ai_scores = probs[:, ai_label_id].tolist()
 
+                    for para, raw_ai_score in zip(batch, raw_ai_scores):
                         human_bonus = calculate_human_features(para)
                         adjusted_score = max(0.0, raw_ai_score - human_bonus)
                         final_ai_score = math.pow(adjusted_score, power)
                         ai_rate = final_ai_score * 100
 
-                    para_len = get_token_length(para)
-                    is_ignored = para_len < min_len
-                    weight = 0 if is_ignored else para_len
+                        para_len = get_token_length(para)
+                        is_ignored = para_len < min_len
+                        weight = 0 if is_ignored else para_len
 
-                    if not is_ignored:
-                        total_weighted_score += (ai_rate * weight)
-                        total_valid_weight += weight
+                        if not is_ignored:
+                            total_weighted_score += (ai_rate * weight)
+                            total_valid_weight += weight
 
                 if total_valid_weight > 0:
                     avg_score = total_weighted_score / total_valid_weight
@@ -1,6 +1,8 @@
+import bisect
 import math
 import html
 import os
+from functools import lru_cache
 
 from PySide6.QtWidgets import (
     QWidget, QPushButton, QLabel, QFrame, QTextEdit, QHBoxLayout, QVBoxLayout, 
@@ -70,6 +72,45 @@ class Theme:
         effect.setColor(Theme.COLORS['dark']['shadow'])
         return effect
 
+    # 绘制热路径共享的画刷/画笔缓存：setBrush(QColor) 每次都会隐式新建
+    # QBrush，动画帧里累计可观；主题目前只有单一深色模式，无需失效逻辑
+    _BRUSH_CACHE = {}
+    _PEN_CACHE = {}
+
+    @classmethod
+    def brush(cls, key):
+        b = cls._BRUSH_CACHE.get(key)
+        if b is None:
+            b = cls._BRUSH_CACHE[key] = QBrush(QColor(cls.get(key)))
+        return b
+
+    @classmethod
+    def pen(cls, key, width=1):
+        k = (key, width)
+        pen = cls._PEN_CACHE.get(k)
+        if pen is None:
+            pen = cls._PEN_CACHE[k] = QPen(QColor(cls.get(key)), width)
+        return pen
+
+# 绘制热路径共享的只读 QColor 缓存：同一主题键的色串只解析一次
+# （返回的是共享实例，需要 setAlpha 等修改时请先 QColor(...) 拷贝一份）
+@lru_cache(maxsize=64)
+def _theme_color(key):
+    return QColor(Theme.get(key))
+
+# 绘制热路径共享的字体实例：QFont 构造要查字体数据库，动画帧里逐次新建并不便宜
+_FONT_TITLE = QFont("Microsoft YaHei", 12, QFont.Bold)
+_FONT_LEGEND = QFont("Microsoft YaHei", 11)
+_FONT_LEGEND_BOLD = QFont("Microsoft YaHei", 11, QFont.Bold)
+_FONT_SCORE = QFont("Segoe UI", 46, QFont.Bold)
+_FONT_PCT = QFont("Segoe UI", 24, QFont.Bold)
+_FONT_TOKENS = QFont("Consolas", 36, QFont.Bold)
+
+# 按钮文字 / 图例暗文字这类逐帧用到的恒定颜色同样只构造一次
+_COLOR_WHITE = QColor("white")
+_LEGEND_DIM = QColor(Theme.get('text_main'))
+_LEGEND_DIM.setAlpha(150)
+
 # ---------------------- 基础 UI 组件 ----------------------
 
 class GlowingButton(QPushButton):
@@ -83,6 +124,9 @@ class GlowingButton(QPushButton):
         self.click_pos = QPointF(0, 0)
         self._hover_progress = 0.0
         self._press_progress = 0.0
+        # 圆角路径按尺寸缓存：动画期间每秒上百帧重绘不再逐帧重建 QPainterPath
+        self._path_size = None
+        self._rect_path = None
         
         self.hover_anim = QPropertyAnimation(self, b"hover_progress", self)
         self.hover_anim.setDuration(250)
@@ -155,21 +199,24 @@ class GlowingButton(QPushButton):
         
         if self.variant in ["primary", "danger"]:
             bg_c = base_c.lighter(100 + int(self._hover_progress * 15))
-            text_c = QColor("white")
+            text_c = _COLOR_WHITE
         else:
             alpha = int(20 + self._hover_progress * 25)
             bg_c = QColor(255, 255, 255, alpha)
-            text_c = QColor(Theme.get('text_main'))
+            text_c = _theme_color('text_main')
 
-        rect_path = QPainterPath()
-        rect_path.addRoundedRect(0, 0, w, h, radius, radius)
+        if self._path_size != (w, h):
+            self._path_size = (w, h)
+            self._rect_path = QPainterPath()
+            self._rect_path.addRoundedRect(0, 0, w, h, radius, radius)
+        rect_path = self._rect_path
         p.setBrush(bg_c)
         p.drawPath(rect_path)
         
         if self._press_progress > 0.0:
             p.save()
             p.setClipPath(rect_path)
-            ripple_c = QColor("white") if self.variant != "secondary" else QColor(Theme.get('text_main'))
+            ripple_c = QColor("white") if self.variant != "secondary" else QColor(_theme_color('text_main'))
             ripple_c.setAlpha(int(60 * (1.0 - self._press_progress)))
             p.setBrush(ripple_c)
             ripple_r = w * self._press_progress
@@ -192,11 +239,19 @@ class ThreeDButton(GlowingButton):
     pass
 
 class ModernProgressBar(QWidget):
+    _BG_COLOR = QColor(255, 255, 255, 15)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFixedHeight(4) 
+        self.setFixedHeight(4)
         self._value = 0
 
+        # 渐变笔刷只建一次：ObjectBoundingMode 让它自动铺满当前填充矩形
+        self._grad = QLinearGradient(0, 0, 1, 0)
+        self._grad.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+        self._grad.setColorAt(0, Theme.ACCENT_BLUE)
+        self._grad.setColorAt(1, QColor("#00F0FF"))
+
     def setValue(self, v):
         self._value = v
         self.update()
@@ -205,22 +260,17 @@ class ModernProgressBar(QWidget):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
         rect = self.rect()
-        
-        bg_c = QColor(255, 255, 255, 15)
-        p.setBrush(bg_c)
+
+        p.setBrush(self._BG_COLOR)
         p.setPen(Qt.NoPen)
         p.drawRoundedRect(rect, 2, 2)
-        
+
         if self._value <= 0:
             p.end()
             return
-            
+
         w = rect.width() * (self._value / 100.0)
-        grad = QLinearGradient(0, 0, w, 0)
-        grad.setColorAt(0, Theme.ACCENT_BLUE)
-        grad.setColorAt(1, QColor("#00F0FF"))
-        
-        p.setBrush(grad)
+        p.setBrush(self._grad)
         p.drawRoundedRect(QRectF(0, 0, w, rect.height()), 2, 2)
         p.end()
 
@@ -232,7 +282,46 @@ class AIGCGaugeWidget(QWidget):
         self._value = 0
         self.animation = QPropertyAnimation(self, b"value")
         self.animation.setDuration(800)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic) 
+        self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        # 动画收尾必须补一帧：节流可能恰好吞掉落在终值上的最后一次重绘
+        self.animation.finished.connect(self._paint_final)
+        self._last_painted = None
+
+        # 逻辑坐标系下恒定的几何体只构建一次，动画帧内直接复用
+        self._arc_rect = QRectF(-110, -110, 220, 220)
+        self._pointer_poly = QPolygonF([QPointF(-4, 0), QPointF(4, 0), QPointF(0, -96)])
+
+        # 灰色轨道弧的离屏缓存：16px 宽的抗锯齿弧每帧栅格化并不便宜，
+        # 动画期间 60 帧里它完全不变，预渲染成位图后逐帧直接贴图
+        self._bg_cache = None
+
+        # 指针轴心画刷/画笔恒定，进度弧画笔与辉光渐变只随三档判定色变化，
+        # 按颜色懒缓存后动画帧内不再重复构造 QPen/QRadialGradient
+        self._pointer_brush = Theme.brush('text_main')
+        self._hub_brush = Theme.brush('bg_card')
+        self._hub_pen = QPen(_theme_color('text_main'), 3)
+        self._arc_pens = {}
+        self._glow_grads = {}
+
+    def resizeEvent(self, event):
+        self._bg_cache = None
+        super().resizeEvent(event)
+
+    def _build_bg_cache(self, offset_x, offset_y, scale):
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+
+        bp = QPainter(pm)
+        bp.setRenderHint(QPainter.Antialiasing)
+        bp.translate(offset_x, offset_y)
+        bp.scale(scale, scale)
+        bp.translate(140, 170)
+        bp.setPen(QPen(QColor(255, 255, 255, 10), 16, Qt.SolidLine, Qt.RoundCap))
+        bp.drawArc(self._arc_rect, 180 * 16, -180 * 16)
+        bp.end()
+        self._bg_cache = pm
 
     @Property(float)
     def value(self):
@@ -241,6 +330,15 @@ class AIGCGaugeWidget(QWidget):
     @value.setter
     def value(self, v):
         self._value = v
+        # 把 60Hz 的动画回调节流到可感知差异：0.4% 对应指针不足 1° 的
+        # 偏转，跳过这一档重绘肉眼无感，动画期间整窗重绘次数近乎减半
+        if self._last_painted is not None and abs(v - self._last_painted) < 0.4:
+            return
+        self._last_painted = v
+        self.update()
+
+    def _paint_final(self):
+        self._last_painted = self._value
         self.update()
 
     def setValue(self, v):
@@ -279,11 +377,15 @@ class AIGCGaugeWidget(QWidget):
         p.translate(140, 170) 
         
         color = self.get_color(self._value)
-        
-        alpha = 30
-        glow = QRadialGradient(0, 0, 140)
-        glow.setColorAt(0, QColor(color.red(), color.green(), color.blue(), alpha))
-        glow.setColorAt(1, QColor(color.red(), color.green(), color.blue(), 0))
+        color_key = color.rgb()
+
+        glow = self._glow_grads.get(color_key)
+        if glow is None:
+            alpha = 30
+            glow = QRadialGradient(0, 0, 140)
+            glow.setColorAt(0, QColor(color.red(), color.green(), color.blue(), alpha))
+            glow.setColorAt(1, QColor(color.red(), color.green(), color.blue(), 0))
+            self._glow_grads[color_key] = glow
         p.setBrush(glow)
         p.setPen(Qt.NoPen)
         p.drawEllipse(-140, -140, 280, 280)
@@ -295,7 +397,7 @@ class AIGCGaugeWidget(QWidget):
         else:
             verdict = "疑似AI"
 
-        p.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
+        p.setFont(_FONT_TITLE)
         fm = QFontMetrics(p.font())
         title_str = "综合判定 " 
         title_w = fm.horizontalAdvance(title_str)
@@ -303,35 +405,40 @@ class AIGCGaugeWidget(QWidget):
         total_w = title_w + verdict_w
         
         start_x = -total_w / 2
-        p.setPen(QColor(Theme.get('text_sub')))
+        p.setPen(_theme_color('text_sub'))
         p.drawText(QRectF(start_x, -165, title_w, 30), Qt.AlignLeft | Qt.AlignVCenter, title_str)
         
         p.setPen(color)
         p.drawText(QRectF(start_x + title_w, -165, verdict_w, 30), Qt.AlignLeft | Qt.AlignVCenter, verdict)
 
-        track_c = QColor(255, 255, 255, 10)
-        p.setPen(QPen(track_c, 16, Qt.SolidLine, Qt.RoundCap))
-        p.drawArc(QRectF(-110, -110, 220, 220), 180 * 16, -180 * 16)
+        if self._bg_cache is None:
+            self._build_bg_cache(offset_x, offset_y, scale)
+        p.save()
+        p.resetTransform()
+        p.drawPixmap(0, 0, self._bg_cache)
+        p.restore()
 
-        p.setPen(QPen(color, 16, Qt.SolidLine, Qt.RoundCap))
+        arc_pen = self._arc_pens.get(color_key)
+        if arc_pen is None:
+            arc_pen = self._arc_pens[color_key] = QPen(color, 16, Qt.SolidLine, Qt.RoundCap)
+        p.setPen(arc_pen)
         span = -(self._value / 100.0) * 180 * 16
-        p.drawArc(QRectF(-110, -110, 220, 220), 180 * 16, span)
+        p.drawArc(self._arc_rect, 180 * 16, span)
 
-        p.setPen(QColor(Theme.get('text_main')))
-        p.setFont(QFont("Segoe UI", 46, QFont.Bold))
+        p.setPen(_theme_color('text_main'))
+        p.setFont(_FONT_SCORE)
         p.drawText(QRectF(-100, -80, 200, 60), Qt.AlignCenter, f"{int(self._value)}%")
 
         p.save()
         angle = (self._value / 100.0) * 180 - 90
         p.rotate(angle)
         
-        pointer_c = QColor(Theme.get('text_main'))
-        p.setBrush(QBrush(pointer_c))
+        p.setBrush(self._pointer_brush)
         p.setPen(Qt.NoPen)
-        p.drawPolygon(QPolygonF([QPointF(-4, 0), QPointF(4, 0), QPointF(0, -96)]))
-        
-        p.setBrush(QBrush(QColor(Theme.get('bg_card')))) 
-        p.setPen(QPen(pointer_c, 3))
+        p.drawPolygon(self._pointer_poly)
+
+        p.setBrush(self._hub_brush)
+        p.setPen(self._hub_pen)
         p.drawEllipse(-6, -6, 12, 12)
         p.restore()
         p.end()
@@ -353,10 +460,13 @@ class AIGCPieChart(QWidget):
         self.setMouseTracking(True)
         self.hover_offsets = [0.0, 0.0, 0.0]
         self.target_offsets = [0.0, 0.0, 0.0]
+
+        self._logical_cache_key = None
+        self._logical_cache = None
         
+        # 悬停缓动定时器按需启动：静止时不再以 60Hz 空转唤醒事件循环
         self.hover_timer = QTimer(self)
         self.hover_timer.timeout.connect(self._smooth_hover_anim)
-        self.hover_timer.start(16)
 
     @Property(float)
     def anim_progress(self):
@@ -380,6 +490,8 @@ class AIGCPieChart(QWidget):
                     needs_update = True
         if needs_update:
             self.update()
+        else:
+            self.hover_timer.stop()
 
     def set_data(self, counts):
         self.counts = counts
@@ -389,20 +501,27 @@ class AIGCPieChart(QWidget):
         self.anim.start()
 
     def _get_logical_params(self):
+        # 几何参数只依赖控件尺寸：悬停追踪 + 重绘双热路径共享同一份缓存
+        size = (self.width(), self.height())
+        if self._logical_cache_key == size:
+            return self._logical_cache
+
         logical_w = 320.0
         logical_h = 190.0
         pad = 5
-        
-        avail_w = max(1, self.width() - pad * 2)
-        avail_h = max(1, self.height() - pad * 2)
-        
+
+        avail_w = max(1, size[0] - pad * 2)
+        avail_h = max(1, size[1] - pad * 2)
+
         scale = min(avail_w / logical_w, avail_h / logical_h)
         scale = max(0.65, scale)
-        
+
         offset_x = pad + (avail_w - logical_w * scale) / 2.0
         offset_y = pad + (avail_h - logical_h * scale) / 2.0
-        
-        return logical_w, logical_h, scale, offset_x, offset_y
+
+        self._logical_cache_key = size
+        self._logical_cache = (logical_w, logical_h, scale, offset_x, offset_y)
+        return self._logical_cache
 
     def mouseMoveEvent(self, event):
         logical_w, logical_h, scale, offset_x, offset_y = self._get_logical_params()
@@ -440,11 +559,15 @@ class AIGCPieChart(QWidget):
             self.hovered_idx = new_hover_idx
             for i in range(3):
                 self.target_offsets[i] = 12.0 if i == self.hovered_idx else 0.0
+            if not self.hover_timer.isActive():
+                self.hover_timer.start(16)
 
     def leaveEvent(self, event):
         self.hovered_idx = -1
         for i in range(3):
             self.target_offsets[i] = 0.0
+        if not self.hover_timer.isActive():
+            self.hover_timer.start(16)
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -456,8 +579,8 @@ class AIGCPieChart(QWidget):
         p.scale(scale, scale)
         
         p.setOpacity(self._anim_progress)
-        p.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
-        p.setPen(QColor(Theme.get('text_sub')))
+        p.setFont(_FONT_TITLE)
+        p.setPen(_theme_color('text_sub'))
         p.drawText(QRectF(15, 10, logical_w - 30, 30), Qt.AlignLeft | Qt.AlignVCenter, "段落成分分布")
         
         center_x = 220.0
@@ -498,7 +621,7 @@ class AIGCPieChart(QWidget):
             start_angle += int(-segment_fraction * 360 * 16)
             accumulated_fraction += segment_fraction
             
-        p.setBrush(QColor(Theme.get('bg_card')))
+        p.setBrush(Theme.brush('bg_card'))
         p.setPen(Qt.NoPen)
         inner_radius = base_radius * 0.65
         p.drawEllipse(QPointF(center_x, center_y), inner_radius, inner_radius)
@@ -507,11 +630,11 @@ class AIGCPieChart(QWidget):
             if self.hovered_idx != -1:
                 pct = int(self.counts[self.hovered_idx] / total * 100) if total else 0
                 p.setPen(QColor(self.colors[self.hovered_idx]))
-                p.setFont(QFont("Segoe UI", 24, QFont.Bold))
+                p.setFont(_FONT_PCT)
                 p.drawText(QRectF(center_x - 45, center_y - 20, 90, 40), Qt.AlignCenter, f"{pct}%")
             else:
-                p.setPen(QColor(Theme.get('text_sub')))
-                p.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
+                p.setPen(_theme_color('text_sub'))
+                p.setFont(_FONT_TITLE)
                 p.drawText(QRectF(center_x - 45, center_y - 20, 90, 40), Qt.AlignCenter, f"共 {total} 段")
                 
         legend_x = 15.0
@@ -526,14 +649,13 @@ class AIGCPieChart(QWidget):
             p.setPen(Qt.NoPen)
             p.drawRoundedRect(QRectF(box_x, legend_y + i * 32, 12, 12), 4, 4)
             
-            text_c = QColor(Theme.get('text_main'))
             if i == self.hovered_idx:
-                p.setFont(QFont("Microsoft YaHei", 11, QFont.Bold))
+                p.setFont(_FONT_LEGEND_BOLD)
                 text_c = c.lighter(110)
             else:
-                p.setFont(QFont("Microsoft YaHei", 11))
-                text_c.setAlpha(150)
-                
+                p.setFont(_FONT_LEGEND)
+                text_c = _LEGEND_DIM
+
             p.setPen(text_c)
             p.drawText(QRectF(box_x + 22, legend_y + i * 32 - 10, 150, 30), Qt.AlignLeft | Qt.AlignVCenter | Qt.TextDontClip, f"{label}: {self.counts[i]}")
             
@@ -585,11 +707,11 @@ class TokenCounterWidget(QWidget):
         p.translate(offset_x, offset_y)
         p.scale(scale, scale)
         
-        p.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
-        p.setPen(QColor(Theme.get('text_sub')))
+        p.setFont(_FONT_TITLE)
+        p.setPen(_theme_color('text_sub'))
         p.drawText(QRectF(0, 30, logical_w, 30), Qt.AlignCenter, "⚡  算力消耗 (Tokens)")
         
-        p.setFont(QFont("Consolas", 36, QFont.Bold))
+        p.setFont(_FONT_TOKENS)
         p.setPen(Theme.ACCENT_BLUE)
         p.drawText(QRectF(0, 80, logical_w, 60), Qt.AlignCenter, f"{self._current_value:,}")
         p.end()
@@ -635,10 +757,14 @@ class HeatmapBar(QWidget):
         self.target_width = 8.0
         self.hovered_idx = -1
         self.block_offsets = []
+
+        # 色块下边界前缀表（按控件高度缓存），命中检测从逐块累加降为二分查找
+        self._bounds = []
+        self._bounds_h = None
         
+        # 同饼图：缓动定时器只在有动画量要收敛时运行
         self.hover_timer = QTimer(self)
         self.hover_timer.timeout.connect(self._smooth_anim)
-        self.hover_timer.start(16)
 
     @Property(float)
     def anim_progress(self):
@@ -666,6 +792,12 @@ class HeatmapBar(QWidget):
                 
         if needs_update:
             self.update()
+        else:
+            self.hover_timer.stop()
+
+    def _wake_hover_anim(self):
+        if not self.hover_timer.isActive():
+            self.hover_timer.start(16)
 
     def set_data(self, paragraphs):
         self.data = []
@@ -688,17 +820,20 @@ class HeatmapBar(QWidget):
             
         self.block_offsets = [0.0] * len(self.data)
         self.hovered_idx = -1
+        self._bounds_h = None
         self.anim.stop()
         self.anim.setStartValue(0.0)
         self.anim.setEndValue(1.0)
         self.anim.start()
 
     def enterEvent(self, event):
-        self.target_width = 14.0 
+        self.target_width = 14.0
+        self._wake_hover_anim()
 
     def leaveEvent(self, event):
         self.target_width = 8.0
         self.hovered_idx = -1
+        self._wake_hover_anim()
 
     def mouseMoveEvent(self, event):
         if not self.data:
@@ -706,18 +841,22 @@ class HeatmapBar(QWidget):
             
         y = event.position().y()
         h = self.height()
-        cur_y = 0.0
-        new_hover = -1
-        
-        for i, it in enumerate(self.data):
-            bh = max(3.0, it['weight'] * h)
-            if cur_y <= y <= cur_y + bh:
-                new_hover = i
-                break
-            cur_y += bh
-            
+
+        if self._bounds_h != h:
+            self._bounds_h = h
+            self._bounds = []
+            cur_y = 0.0
+            for it in self.data:
+                cur_y += max(3.0, it['weight'] * h)
+                self._bounds.append(cur_y)
+
+        new_hover = bisect.bisect_left(self._bounds, y)
+        if new_hover >= len(self.data) or y < 0:
+            new_hover = -1
+
         if new_hover != self.hovered_idx:
             self.hovered_idx = new_hover
+            self._wake_hover_anim()
 
     def mousePressEvent(self, event):
         if -1 < self.hovered_idx < len(self.data):
@@ -939,6 +1078,22 @@ class ResultBlock(QWidget):
     request_highlight = Signal(str)
     expanded = Signal(int)
 
+    # 每个卡片都相同的样式串在类级只格式化一次，长文档批量建卡不再重复拼接
+    _TOKEN_CSS = f"color: {Theme.ACCENT_BLUE.name()}; font-size: 11px; font-weight: bold; font-family: Consolas; background-color: rgba(59, 130, 246, 0.1); border-radius: 6px; padding: 3px 8px;"
+    _COPY_CSS = f"""
+            QPushButton {{
+                background: transparent;
+                color: {Theme.get('text_sub')};
+                border-radius: 6px;
+                font-size: 14px;
+                padding-bottom: 2px;
+            }}
+            QPushButton:hover {{
+                background: rgba(255,255,255,0.1);
+                color: {Theme.get('text_main')};
+            }}
+        """
+
     def __init__(self, index, content, ai_rate, tokens=0, is_ignored=False, use_animation=True, parent=None):
         super().__init__(parent)
         self.index = index
@@ -947,7 +1102,8 @@ class ResultBlock(QWidget):
         self.is_ignored = is_ignored
         self.is_expanded = False
         self.is_init = False
-        
+        self._applied_css = {}
+
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setCursor(Qt.PointingHandCursor) 
         
@@ -980,7 +1136,7 @@ class ResultBlock(QWidget):
         self.idx_l = QLabel(f"#{index + 1}")
         
         self.token_l = QLabel(f"⚡ {tokens} Tokens")
-        self.token_l.setStyleSheet(f"color: {Theme.ACCENT_BLUE.name()}; font-size: 11px; font-weight: bold; font-family: Consolas; background-color: rgba(59, 130, 246, 0.1); border-radius: 6px; padding: 3px 8px;")
+        self.token_l.setStyleSheet(self._TOKEN_CSS)
         
         self.risk_l = QLabel(f"{int(ai_rate)}% {self.verdict}")
         self.risk_l.setAlignment(Qt.AlignCenter)
@@ -993,19 +1149,7 @@ class ResultBlock(QWidget):
         self.btn_copy.setFixedSize(26, 26)
         self.btn_copy.setCursor(Qt.PointingHandCursor)
         self.btn_copy.setToolTip("一键复制此高危段落")
-        self.btn_copy.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                color: {Theme.get('text_sub')};
-                border-radius: 6px;
-                font-size: 14px;
-                padding-bottom: 2px;
-            }}
-            QPushButton:hover {{
-                background: rgba(255,255,255,0.1);
-                color: {Theme.get('text_main')};
-            }}
-        """)
+        self.btn_copy.setStyleSheet(self._COPY_CSS)
         self.btn_copy.clicked.connect(self._copy_content)
         
         self.arr_l = QLabel("▼")
@@ -1065,20 +1209,26 @@ class ResultBlock(QWidget):
         else:
             self.verdict = "疑似生成"
 
+    def _apply_css(self, widget, css):
+        # 样式串没变时跳过 setStyleSheet，省掉 Qt 的重复解析与全量 re-polish
+        if self._applied_css.get(widget) != css:
+            self._applied_css[widget] = css
+            widget.setStyleSheet(css)
+
     def update_style(self):
-        self.idx_l.setStyleSheet(f"color: {Theme.get('text_sub')}; font-weight: bold; font-family: 'Segoe UI';")
-        self.risk_l.setStyleSheet(f"background-color: {self.acc_bg}; color: {self.acc_c}; border-radius: 12px; padding: 4px 10px; font-weight: 900; font-family: 'Microsoft YaHei';")
-        self.prev_l.setStyleSheet(f"color: {Theme.get('text_sub')}; margin-left: 5px;")
-        self.arr_l.setStyleSheet(f"color: {Theme.get('text_sub')};")
-        
+        self._apply_css(self.idx_l, f"color: {Theme.get('text_sub')}; font-weight: bold; font-family: 'Segoe UI';")
+        self._apply_css(self.risk_l, f"background-color: {self.acc_bg}; color: {self.acc_c}; border-radius: 12px; padding: 4px 10px; font-weight: 900; font-family: 'Microsoft YaHei';")
+        self._apply_css(self.prev_l, f"color: {Theme.get('text_sub')}; margin-left: 5px;")
+        self._apply_css(self.arr_l, f"color: {Theme.get('text_sub')};")
+
         bg = Theme.get('bg_card')
         bd = Theme.get('border')
         h_bg = QColor(bg).lighter(104).name()
-        
+
         if self.is_expanded:
-            self.head.setStyleSheet(f"QFrame {{ background-color: {h_bg}; border: 1px solid {bd}; border-bottom: none; border-top-left-radius: 12px; border-top-right-radius: 12px; }}")
+            self._apply_css(self.head, f"QFrame {{ background-color: {h_bg}; border: 1px solid {bd}; border-bottom: none; border-top-left-radius: 12px; border-top-right-radius: 12px; }}")
         else:
-            self.head.setStyleSheet(f"QFrame {{ background-color: {bg}; border: 1px solid {bd}; border-radius: 12px; }} QFrame:hover {{ background-color: {h_bg}; border: 1px solid rgba(255, 255, 255, 0.1); }}")
+            self._apply_css(self.head, f"QFrame {{ background-color: {bg}; border: 1px solid {bd}; border-radius: 12px; }} QFrame:hover {{ background-color: {h_bg}; border: 1px solid rgba(255, 255, 255, 0.1); }}")
 
     def _ensure_content_initialized(self):
         if self.is_init:
@@ -1174,7 +1324,7 @@ class ResultBlock(QWidget):
 
     def _reset_copy_btn(self):
         self.btn_copy.setText("📋")
-        self.btn_copy.setStyleSheet(f"QPushButton {{ background: transparent; color: {Theme.get('text_sub')}; border-radius: 6px; font-size: 14px; padding-bottom: 2px; }} QPushButton:hover {{ background: rgba(255,255,255,0.1); color: {Theme.get('text_main')}; }}")
+        self.btn_copy.setStyleSheet(self._COPY_CSS)
 
     def mousePressEvent(self, e):
         self.toggle_expand()
@@ -1194,7 +1344,8 @@ class DetailedHeatmapRow(QFrame):
         self.content = content
         self.ai_rate = ai_rate
         self.is_ignored = is_ignored
-        
+        self._applied_css = {}
+
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(52)
         
@@ -1240,15 +1391,21 @@ class DetailedHeatmapRow(QFrame):
         else:
             self.verdict = "AI"
 
+    def _apply_css(self, widget, css):
+        # 同 ResultBlock：全景窗口批量刷新时，不变的样式串直接跳过
+        if self._applied_css.get(widget) != css:
+            self._applied_css[widget] = css
+            widget.setStyleSheet(css)
+
     def update_style(self):
         bg = Theme.get('bg_card')
         bd = Theme.get('border')
         hover_bg = QColor(bg).lighter(104).name()
-        
-        self.setStyleSheet(f"DetailedHeatmapRow {{ background-color: {bg}; border: 1px solid {bd}; border-radius: 12px; }} DetailedHeatmapRow:hover {{ background-color: {hover_bg}; }}")
-        self.idx_lbl.setStyleSheet(f"color: {Theme.get('text_sub')}; font-weight: bold; font-family: 'Segoe UI';")
-        self.preview_lbl.setStyleSheet(f"color: {Theme.get('text_main')};")
-        self.score_lbl.setStyleSheet(f"background-color: {self.accent_bg}; color: {self.accent_color}; border-radius: 12px; padding: 4px 10px; font-weight: bold; border: none; font-family: 'Microsoft YaHei';")
+
+        self._apply_css(self, f"DetailedHeatmapRow {{ background-color: {bg}; border: 1px solid {bd}; border-radius: 12px; }} DetailedHeatmapRow:hover {{ background-color: {hover_bg}; }}")
+        self._apply_css(self.idx_lbl, f"color: {Theme.get('text_sub')}; font-weight: bold; font-family: 'Segoe UI';")
+        self._apply_css(self.preview_lbl, f"color: {Theme.get('text_main')};")
+        self._apply_css(self.score_lbl, f"background-color: {self.accent_bg}; color: {self.accent_color}; border-radius: 12px; padding: 4px 10px; font-weight: bold; border: none; font-family: 'Microsoft YaHei';")
 
     def mousePressEvent(self, event):
         self.clicked.emit(self.index)